@@ -1,71 +1,331 @@
-import requests
+import httpx
+import asyncio
+import threading
+import functools
+import time
+import cachetools
+import orjson
 import base64
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, rsa, ed25519
 from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidSignature
 import utils
 import datetime
 
 
+_METHOD_BYTES = {
+    "GET": b"GET",
+    "POST": b"POST",
+    "PUT": b"PUT",
+    "DELETE": b"DELETE",
+}
+
+# POST is never retried: replaying a create_order after a 5xx could
+# place the same order twice.
+_RETRY_METHODS = frozenset(["GET", "PUT", "DELETE"])
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+# Upper bound on a server-supplied Retry-After, in seconds.
+_MAX_RETRY_AFTER = 10.0
+
+# Endpoints whose path is a literal; their URL and signed path are
+# built once per client instead of on every request.
+_STATIC_ENDPOINTS = (
+    "/api_version",
+    "/communications/id",
+    "/communications/quotes",
+    "/communications/rfqs",
+    "/events",
+    "/exchange/announcements",
+    "/exchange/schedule",
+    "/exchange/status",
+    "/exchange/user_data_timestamp",
+    "/markets",
+    "/markets/trades",
+    "/milestones/",
+    "/portfolio/balance",
+    "/portfolio/fills",
+    "/portfolio/orders",
+    "/portfolio/orders/batched",
+    "/portfolio/positions",
+    "/portfolio/settlements",
+    "/portfolio/summary/resting_order_total_value",
+    "/series/",
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _join_tickers(tickers):
+    # Keyed on a frozenset so the same watchlist in any order is joined
+    # once and always yields the same query string (and cache key).
+    return ",".join(sorted(tickers))
+
+
 class KalshiClient:
+    __slots__ = (
+        "base_url",
+        "_static",
+        "key_id",
+        "session",
+        "max_retries",
+        "backoff_factor",
+        "_cache",
+        "_validators",
+        "_cache_lock",
+        "private_key",
+        "signature_algo",
+        "_sha",
+        "_pss",
+        "_signer",
+    )
+
+    _session_class = httpx.Client
+
     def __init__(
         self,
         key_id,
         private_key_path,
         env="test",
+        signature_algo=None,
+        cache_ttl=60,
+        cache_maxsize=512,
+        validator_maxsize=128,
+        max_connections=64,
+        max_keepalive_connections=32,
+        max_retries=5,
+        backoff_factor=0.2,
     ):
         if env == "prod":
             self.base_url = "https://api.elections.kalshi.com/trade-api/v2"
         else:
             self.base_url = "https://demo-api.kalshi.co/trade-api/v2"
+        self._static = {
+            endpoint: (
+                f"{self.base_url}{endpoint}",
+                f"/trade-api/v2{endpoint}".encode("utf-8"),
+            )
+            for endpoint in _STATIC_ENDPOINTS
+        }
 
         self.key_id = key_id
-        self.session = requests.Session()
+        # httpx already advertises every content encoding it can decode
+        # (gzip/deflate, plus br/zstd when those codecs are installed).
+        self.session = self._session_class(
+            http2=True,
+            headers={
+                "KALSHI-ACCESS-KEY": key_id,
+                "Accept": "application/json",
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=30.0,
+        )
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._cache = cachetools.TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        # ETag/Last-Modified and body of recent GETs, for 304 revalidation
+        self._validators = cachetools.LRUCache(maxsize=validator_maxsize)
+        self._cache_lock = threading.Lock()
 
         with open(private_key_path, "rb") as key_file:
             self.private_key = serialization.load_pem_private_key(
                 key_file.read(), password=None, backend=default_backend()
             )
 
-    def _generate_headers(self, method, path):
+        if isinstance(self.private_key, ed25519.Ed25519PrivateKey):
+            key_algo = "ed25519"
+        elif isinstance(self.private_key, rsa.RSAPrivateKey):
+            key_algo = "rsa-pss"
+        else:
+            raise ValueError("private key must be RSA or Ed25519")
+        if signature_algo is not None and signature_algo != key_algo:
+            raise ValueError(
+                f"signature_algo {signature_algo!r} does not match the "
+                f"{key_algo} private key"
+            )
+        self.signature_algo = key_algo
+
+        self._sha = hashes.SHA256()
+        self._pss = padding.PSS(
+            mgf=padding.MGF1(self._sha),
+            salt_length=padding.PSS.DIGEST_LENGTH,
+        )
+        # Bind the signing call once so each request makes a single call
+        # into OpenSSL with no per-request key-type dispatch.
+        if key_algo == "ed25519":
+            self._signer = self.private_key.sign
+        else:
+            self._signer = functools.partial(
+                self.private_key.sign, padding=self._pss, algorithm=self._sha
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _request(self, method, endpoint, params=None, data=None, cache=False):
+        url, sign_path, cache_key, validator_key, validator, content = (
+            self._prepare_request(method, endpoint, params, data)
+        )
+        if cache:
+            cached = self._cache_lookup(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=self._request_headers(
+                        method, sign_path, content, validator
+                    ),
+                    params=params,
+                    content=content
+                )
+            except httpx.TransportError:
+                delay = self._retry_delay(method, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+            time.sleep(delay)
+            attempt += 1
+        body = self._handle_response(response, validator_key, validator)
+        # Cache the raw bytes, not the parsed dict, so every caller gets
+        # its own object and mutating it can't corrupt later hits.
+        if cache:
+            self._cache_store(cache_key, body)
+        return orjson.loads(body)
+
+    def _prepare_request(self, method, endpoint, params, data):
+        # Callers pass an upper-case method and a "/"-prefixed endpoint;
+        # check that in debug runs rather than normalising every call.
+        assert method in _METHOD_BYTES and endpoint.startswith("/"), (
+            method, endpoint
+        )
+        static = self._static.get(endpoint)
+        if static is not None:
+            url, sign_path = static
+        else:
+            url = f"{self.base_url}{endpoint}"
+            sign_path = f"/trade-api/v2{endpoint}".encode("utf-8")
+        cache_key = validator_key = validator = None
+        if method == "GET":
+            cache_key = self._cache_key(endpoint, params)
+            # Cursor pages are fetched once and never revalidated, so
+            # keeping their bodies would only evict useful entries.
+            if not (params and "cursor" in params):
+                validator_key = cache_key
+                # Read once per request: the same tuple sets the
+                # conditional headers and answers a 304, so an eviction
+                # between the two can't leave a 304 with no body.
+                with self._cache_lock:
+                    validator = self._validators.get(validator_key)
+        content = None if data is None else orjson.dumps(data)
+        return url, sign_path, cache_key, validator_key, validator, content
+
+    def _request_headers(self, method, sign_path, content=None,
+                         validator=None):
+        # Called once per attempt so the signed timestamp stays fresh. The
+        # dict is built per call, not shared, so threads can't race.
         timestamp = utils.get_curr_time_milliseconds()
-        timestamp_str = str(timestamp)
-        payload = f"{timestamp_str}{method.upper()}{path}".encode("utf-8")
         try:
-            signature = self.private_key.sign(
-                payload,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.DIGEST_LENGTH,
-                ),
-                hashes.SHA256(),
+            signature = self._signer(
+                b"%d%b%b" % (timestamp, _METHOD_BYTES[method], sign_path)
             )
-            signature = base64.b64encode(signature).decode("utf-8")
         except InvalidSignature as e:
-            raise ValueError("RSA sign PSS failed") from e
-
-        return {
-            "KALSHI-ACCESS-KEY": self.key_id,
-            "KALSHI-ACCESS-SIGNATURE": signature,
-            "KALSHI-ACCESS-TIMESTAMP": timestamp_str,
+            raise ValueError(f"{self.signature_algo} sign failed") from e
+        headers = {
+            "KALSHI-ACCESS-SIGNATURE": base64.b64encode(signature).decode(
+                "utf-8"
+            ),
+            "KALSHI-ACCESS-TIMESTAMP": str(timestamp),
         }
-
-    def _request(self, method, endpoint, params=None, data=None):
-        path = endpoint if endpoint.startswith("/") else "/" + endpoint
-        url = f"{self.base_url}{path}"
-        headers = self._generate_headers(method, "/trade-api/v2" + path)
-        response = self.session.request(
-            method=method.upper(),
-            url=url, headers=headers,
-            params=params,
-            json=data
-        )
+        if content is not None:
+            headers["Content-Type"] = "application/json"
+        if validator is not None:
+            etag, last_modified, _ = validator
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _retry_delay(self, method, response, attempt):
+        # response is None when the attempt failed at the transport
+        # level (connect/read error, dropped HTTP/2 connection).
+        if attempt >= self.max_retries or method not in _RETRY_METHODS:
+            return None
+        if response is not None:
+            if response.status_code not in _RETRY_STATUSES:
+                return None
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None and retry_after.isdigit():
+                return min(float(retry_after), _MAX_RETRY_AFTER)
+        return self.backoff_factor * (2 ** attempt)
+
+    @staticmethod
+    def _params(**kwargs):
+        return {k: v for k, v in kwargs.items() if v is not None}
+
+    def _handle_response(self, response, validator_key, validator):
+        if response.status_code == 304 and validator is not None:
+            return validator[2]
         response.raise_for_status()
-        return response.json()
-
-    def _get(self, endpoint, params=None):
-        return self._request("GET", endpoint, params=params)
+        if validator_key is not None:
+            self._store_validators(validator_key, response)
+        return response.content
+
+    def _store_validators(self, validator_key, response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._cache_lock:
+            if etag is None and last_modified is None:
+                self._validators.pop(validator_key, None)
+            else:
+                self._validators[validator_key] = (
+                    etag, last_modified, response.content
+                )
+
+    @staticmethod
+    def _cache_key(path, params):
+        if not params:
+            return (path, None)
+        try:
+            return (path, frozenset(params.items()))
+        except TypeError:
+            # List values (sent by httpx as repeated keys) aren't
+            # hashable; key them by their tuple instead.
+            return (path, frozenset(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in params.items()
+            ))
+
+    def _cache_lookup(self, cache_key):
+        with self._cache_lock:
+            return self._cache.get(cache_key)
+
+    def _cache_store(self, cache_key, body):
+        with self._cache_lock:
+            self._cache[cache_key] = body
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+            self._validators.clear()
+
+    def _get(self, endpoint, params=None, cache=False):
+        return self._request("GET", endpoint, params=params, cache=cache)
 
     def _post(self, endpoint, data=None):
         return self._request("POST", endpoint, data=data)
@@ -73,12 +333,12 @@ class KalshiClient:
     def _put(self, endpoint, data=None):
         return self._request("PUT", endpoint, data=data)
 
-    def _delete(self, endpoint):
-        return self._request("DELETE", endpoint)
+    def _delete(self, endpoint, data=None):
+        return self._request("DELETE", endpoint, data=data)
 
     # Public
-    def get_api_version(self):
-        return self._get("/api_version")
+    def get_api_version(self, cache=True):
+        return self._get("/api_version", cache=cache)
 
     # Communications
     def get_communications_id(self):
@@ -95,24 +355,16 @@ class KalshiClient:
         rfq_creator_user_id=None,
         rfq_id=None
     ):
-        params = {}
-        if cursor is not None:
-            params["cursor"] = cursor
-        if limit is not None:
-            params["limit"] = limit
-        if market_ticker is not None:
-            params["market_ticker"] = market_ticker
-        if event_ticker is not None:
-            params["event_ticker"] = event_ticker
-        if status is not None:
-            params["status"] = status
-        if quote_creator_user_id is not None:
-            params["quote_creator_user_id"] = quote_creator_user_id
-        if rfq_creator_user_id is not None:
-            params["rfq_creator_user_id"] = rfq_creator_user_id
-        if rfq_id is not None:
-            params["rfq_id"] = rfq_id
-
+        params = self._params(
+            cursor=cursor,
+            limit=limit,
+            market_ticker=market_ticker,
+            event_ticker=event_ticker,
+            status=status,
+            quote_creator_user_id=quote_creator_user_id,
+            rfq_creator_user_id=rfq_creator_user_id,
+            rfq_id=rfq_id,
+        )
         return self._get("/communications/quotes", params=params)
 
     def create_quote(
@@ -122,17 +374,13 @@ class KalshiClient:
         no_bid=None,
         rest_remainder=None
     ):
-        params = {}
-        if rfq_id is not None:
-            params["rfq_id"] = rfq_id
-        if yes_bid is not None:
-            params["yes_bid"] = yes_bid
-        if no_bid is not None:
-            params["no_bid"] = no_bid
-        if rest_remainder is not None:
-            params["rest_remainder"] = rest_remainder
-
-        return self._post("/communications/quotes", params=params)
+        data = self._params(
+            rfq_id=rfq_id,
+            yes_bid=yes_bid,
+            no_bid=no_bid,
+            rest_remainder=rest_remainder,
+        )
+        return self._post("/communications/quotes", data)
 
     def get_quote(self, quote_id):
         return self._get(f"/communications/quotes/{quote_id}")
@@ -155,20 +403,14 @@ class KalshiClient:
         status=None,
         creator_user_id=None
     ):
-        params = {}
-        if cursor is not None:
-            params["cursor"] = cursor
-        if limit is not None:
-            params["limit"] = limit
-        if market_ticker is not None:
-            params["market_ticker"] = market_ticker
-        if event_ticker is not None:
-            params["event_ticker"] = event_ticker
-        if status is not None:
-            params["status"] = status
-        if creator_user_id is not None:
-            params["creator_user_id"] = creator_user_id
-        
+        params = self._params(
+            cursor=cursor,
+            limit=limit,
+            market_ticker=market_ticker,
+            event_ticker=event_ticker,
+            status=status,
+            creator_user_id=creator_user_id,
+        )
         return self._get("/communications/rfqs", params=params)
 
     def create_rfq(
@@ -177,15 +419,12 @@ class KalshiClient:
         contracts=None,
         rest_remainder=None
     ):
-        params = {}
-        if market_ticker is not None:
-            params["market_ticker"] = market_ticker
-        if contracts is not None:
-            params["contracts"] = contracts
-        if rest_remainder is not None:
-            params["rest_remainder"] = rest_remainder
-    
-        return self._post("/communications/rfqs", params=params)
+        data = self._params(
+            market_ticker=market_ticker,
+            contracts=contracts,
+            rest_remainder=rest_remainder,
+        )
+        return self._post("/communications/rfqs", data)
 
     def get_rfq(self, rfq_id):
         return self._get(f"/communications/rfqs/{rfq_id}")
@@ -202,57 +441,44 @@ class KalshiClient:
         series_ticker=None,
         with_nested_markets=None
     ):
-        params = {}
-        if limit is not None:
-            params["limit"] = limit
-        if cursor is not None:
-            params["cursor"] = cursor
-        if status is not None:
-            params["status"] = status
-        if series_ticker is not None:
-            params["series_ticker"] = series_ticker
-        if with_nested_markets is not None:
-            params["with_nested_markets"] = with_nested_markets
-        
+        params = self._params(
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            series_ticker=series_ticker,
+            with_nested_markets=with_nested_markets,
+        )
         return self._get("/events", params=params)
 
-    def get_event(self, event_ticker, with_nested_markets=None):
-        params = {}
-        if with_nested_markets is not None:
-            params["with_nested_markets"] = with_nested_markets
-
-        return self._get(f"/events/{event_ticker}", params=params)
+    def get_event(self, event_ticker, with_nested_markets=None, cache=False):
+        params = self._params(with_nested_markets=with_nested_markets)
+        return self._get(f"/events/{event_ticker}", params=params, cache=cache)
 
     def get_markets(
         self,
-        limit=None,
+        limit=1000,
         cursor=None,
         event_ticker=None,
         series_ticker=None,
         max_close_ts=None,
         min_close_ts=None,
         status=None,
-        tickers=None
+        tickers=None,
+        cache=False
     ):
-        params = {}
-        if limit is not None:
-            params["limit"] = limit
-        if cursor is not None:
-            params["cursor"] = cursor
-        if event_ticker is not None:
-            params["event_ticker"] = event_ticker
-        if series_ticker is not None:
-            params["series_ticker"] = series_ticker
-        if max_close_ts is not None:
-            params["max_close_ts"] = max_close_ts
-        if min_close_ts is not None:
-            params["min_close_ts"] = min_close_ts
-        if status is not None:
-            params["status"] = status
-        if tickers is not None:
-            params["tickers"] = tickers
-
-        return self._get("/markets?limit=1000", params=params)
+        if isinstance(tickers, (list, tuple, set, frozenset)):
+            tickers = _join_tickers(frozenset(tickers))
+        params = self._params(
+            limit=limit,
+            cursor=cursor,
+            event_ticker=event_ticker,
+            series_ticker=series_ticker,
+            max_close_ts=max_close_ts,
+            min_close_ts=min_close_ts,
+            status=status,
+            tickers=tickers,
+        )
+        return self._get("/markets", params=params, cache=cache)
 
     def get_trades(
         self,
@@ -262,41 +488,36 @@ class KalshiClient:
         min_ts=None,
         max_ts=None
     ):
-        params = {}
-        if cursor is not None:
-            params["cursor"] = cursor
-        if limit is not None:
-            params["limit"] = limit
-        if ticker is not None:
-            params["ticker"] = ticker
-        if min_ts is not None:
-            params["min_ts"] = min_ts
-        if max_ts is not None:
-            params["max_ts"] = max_ts
-
+        params = self._params(
+            cursor=cursor,
+            limit=limit,
+            ticker=ticker,
+            min_ts=min_ts,
+            max_ts=max_ts,
+        )
         return self._get("/markets/trades", params=params)
 
     def get_market(self, market_ticker):
         return self._get(f"/markets/{market_ticker}")
 
     def get_market_orderbook(self, market_ticker, depth=None):
-        params = {}
-        if depth is not None:
-            params["depth"] = depth
-
+        params = self._params(depth=depth)
         return self._get(f"/markets/{market_ticker}/orderbook", params=params)
 
-    def get_series_list(self, category=None, include_product_metadata=None):
-        params = {}
-        if category is not None:
-            params["category"] = category
-        if include_product_metadata is not None:
-            params["include_product_metadata"] = include_product_metadata
-
-        return self._get("/series/", params=params)
+    def get_series_list(
+        self,
+        category=None,
+        include_product_metadata=None,
+        cache=True
+    ):
+        params = self._params(
+            category=category,
+            include_product_metadata=include_product_metadata,
+        )
+        return self._get("/series/", params=params, cache=cache)
 
-    def get_series(self, series_ticker):
-        return self._get(f"/series/{series_ticker}")
+    def get_series(self, series_ticker, cache=True):
+        return self._get(f"/series/{series_ticker}", cache=cache)
 
     def get_market_candlesticks(
         self,
@@ -317,14 +538,14 @@ class KalshiClient:
         )
 
     # Exchange
-    def get_announcements(self):
-        return self._get("/exchange/announcements")
+    def get_announcements(self, cache=True):
+        return self._get("/exchange/announcements", cache=cache)
 
-    def get_schedule(self):
-        return self._get("/exchange/schedule")
+    def get_schedule(self, cache=True):
+        return self._get("/exchange/schedule", cache=cache)
 
-    def get_status(self):
-        return self._get("/exchange/status")
+    def get_status(self, cache=True):
+        return self._get("/exchange/status", cache=cache)
 
     def get_user_data_timestamp(self):
         return self._get("/exchange/user_data_timestamp")
@@ -339,20 +560,14 @@ class KalshiClient:
         related_event_ticker=None,
         cursor=None
     ):
-        params = {
-            "limit": limit
-        }
-        if minimum_start_date is not None:
-            params["minimum_start_date"] = minimum_start_date
-        if category is not None:
-            params["category"] = category
-        if _type is not None:
-            params["type"] = _type
-        if related_event_ticker is not None:
-            params["related_event_ticker"] = related_event_ticker
-        if cursor is not None:
-            params["cursor"] = cursor
-
+        params = self._params(
+            limit=limit,
+            minimum_start_date=minimum_start_date,
+            category=category,
+            type=_type,
+            related_event_ticker=related_event_ticker,
+            cursor=cursor,
+        )
         return self._get("/milestones/", params=params)
 
     def get_milestone(self, milestone_id):
@@ -390,18 +605,13 @@ class KalshiClient:
         limit=None,
         cursor=None,
     ):
-        params = {}
-        if ticker is not None:
-            params["ticker"] = ticker
-        if min_ts is not None:
-            params["min_ts"] = min_ts
-        if max_ts is not None:
-            params["max_ts"] = max_ts
-        if limit is not None:
-            params["limit"] = limit
-        if cursor is not None:
-            params["cursor"] = cursor
-
+        params = self._params(
+            ticker=ticker,
+            min_ts=min_ts,
+            max_ts=max_ts,
+            limit=limit,
+            cursor=cursor,
+        )
         return self._get("/portfolio/fills", params=params)
 
     def get_orders(
@@ -414,22 +624,15 @@ class KalshiClient:
         cursor=None,
         limit=None,
     ):
-        params = {}
-        if ticker is not None:
-            params["ticker"] = ticker
-        if event_ticker is not None:
-            params["event_ticker"] = event_ticker
-        if min_ts is not None:
-            params["min_ts"] = min_ts
-        if max_ts is not None:
-            params["max_ts"] = max_ts
-        if status is not None:
-            params["status"] = status
-        if cursor is not None:
-            params["cursor"] = cursor
-        if limit is not None:
-            params["limit"] = limit
-
+        params = self._params(
+            ticker=ticker,
+            event_ticker=event_ticker,
+            min_ts=min_ts,
+            max_ts=max_ts,
+            status=status,
+            cursor=cursor,
+            limit=limit,
+        )
         return self._get("/portfolio/orders", params=params)
 
     def create_order(self, data):
@@ -462,20 +665,14 @@ class KalshiClient:
         ticker=None,
         event_ticker=None,
     ):
-        params = {}
-        if cursor is not None:
-            params["cursor"] = cursor
-        if limit is not None:
-            params["limit"] = limit
-        if count_filter is not None:
-            params["count_filter"] = count_filter
-        if settlement_status is not None:
-            params["settlement_status"] = settlement_status
-        if ticker is not None:
-            params["ticker"] = ticker
-        if event_ticker is not None:
-            params["event_ticker"] = event_ticker
-   
+        params = self._params(
+            cursor=cursor,
+            limit=limit,
+            count_filter=count_filter,
+            settlement_status=settlement_status,
+            ticker=ticker,
+            event_ticker=event_ticker,
+        )
         return self._get("/portfolio/positions", params=params)
 
     def get_portfolio_settlements(
@@ -485,16 +682,12 @@ class KalshiClient:
         max_ts=None,
         cursor=None
     ):
-        params = {}
-        if limit is not None:
-            params["limit"] = limit
-        if min_ts is not None:
-            params["min_ts"] = min_ts
-        if max_ts is not None:
-            params["max_ts"] = max_ts
-        if cursor is not None:
-            params["cursor"] = cursor
-
+        params = self._params(
+            limit=limit,
+            min_ts=min_ts,
+            max_ts=max_ts,
+            cursor=cursor,
+        )
         return self._get("/portfolio/settlements", params=params)
 
     def get_portfolio_resting_order_total_value(self):
@@ -503,3 +696,157 @@ class KalshiClient:
     # Structured Target
     def get_structured_target(self, structured_target_id):
         return self._get(f"/structured_targets/{structured_target_id}")
+
+
+class AsyncKalshiClient(KalshiClient):
+    """Async mirror of KalshiClient.
+
+    Every endpoint wrapper returns an awaitable, so many calls can be
+    overlapped on one event loop with asyncio.gather / batch_get.
+    """
+
+    __slots__ = ()
+
+    _session_class = httpx.AsyncClient
+
+    def __enter__(self):
+        raise TypeError(
+            "AsyncKalshiClient must be used with 'async with', not 'with'"
+        )
+
+    def close(self):
+        raise TypeError("AsyncKalshiClient is closed with 'await aclose()'")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.session.aclose()
+
+    async def _request(
+        self, method, endpoint, params=None, data=None, cache=False
+    ):
+        url, sign_path, cache_key, validator_key, validator, content = (
+            self._prepare_request(method, endpoint, params, data)
+        )
+        if cache:
+            cached = self._cache_lookup(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        attempt = 0
+        while True:
+            try:
+                response = await self.session.request(
+                    method=method,
+                    url=url,
+                    headers=self._request_headers(
+                        method, sign_path, content, validator
+                    ),
+                    params=params,
+                    content=content
+                )
+            except httpx.TransportError:
+                delay = self._retry_delay(method, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+            attempt += 1
+        body = self._handle_response(response, validator_key, validator)
+        # Cache the raw bytes, not the parsed dict, so every caller gets
+        # its own object and mutating it can't corrupt later hits.
+        if cache:
+            self._cache_store(cache_key, body)
+        return orjson.loads(body)
+
+    async def batch_get(self, endpoint_params):
+        """GET every (endpoint, params) pair concurrently, results in order.
+
+        Endpoints are paths under the API root and must start with "/".
+        """
+        return await asyncio.gather(
+            *(self._get(endpoint, params=params)
+              for endpoint, params in endpoint_params)
+        )
+
+    async def paginate(self, method, items_key, **kwargs):
+        """Follow `cursor` through every page of method, serially.
+
+        This is the fallback for endpoints that can't be split into
+        min_ts/max_ts windows (e.g. get_positions, get_events).
+        """
+        items = []
+        cursor = None
+        while True:
+            response = await method(cursor=cursor, **kwargs)
+            items.extend(response.get(items_key) or ())
+            cursor = response.get("cursor")
+            if not cursor:
+                return items
+
+    async def paginate_trades(
+        self,
+        ticker,
+        start_ts: datetime.datetime,
+        end_ts: datetime.datetime,
+        window_sec=3600,
+        concurrency=8
+    ):
+        """All trades for ticker in [start_ts, end_ts], newest first.
+
+        The range is cut into window_sec windows that are paged
+        concurrently (at most `concurrency` at a time). Raises ValueError
+        if end_ts is before start_ts.
+        """
+        trades = await self._paginate_windows(
+            self.get_trades,
+            "trades",
+            "trade_id",
+            utils.get_seconds_since_epoch(start_ts),
+            utils.get_seconds_since_epoch(end_ts),
+            window_sec,
+            concurrency,
+            ticker=ticker,
+            limit=1000,
+        )
+        trades.sort(key=lambda trade: trade["created_time"], reverse=True)
+        return trades
+
+    async def _paginate_windows(
+        self,
+        method,
+        items_key,
+        id_key,
+        start,
+        end,
+        window_sec,
+        concurrency,
+        **kwargs
+    ):
+        if end < start:
+            raise ValueError(f"end ({end}) is before start ({start})")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_window(min_ts, max_ts):
+            async with semaphore:
+                return await self.paginate(
+                    method, items_key, min_ts=min_ts, max_ts=max_ts, **kwargs
+                )
+
+        pages = await asyncio.gather(*(
+            fetch_window(min_ts, min(min_ts + window_sec, end))
+            # start == end still gets its one [start, end] window.
+            for min_ts in range(start, max(end, start + 1), window_sec)
+        ))
+        # Windows share their boundary second, so drop repeats by id.
+        items = {}
+        for page in pages:
+            for item in page:
+                items.setdefault(item[id_key], item)
+        return list(items.values())
@@ -0,0 +1,182 @@
+import asyncio
+import itertools
+import logging
+import orjson
+from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosed
+from kalshiClient import AsyncKalshiClient
+
+logger = logging.getLogger(__name__)
+
+
+class _SequenceGap(Exception):
+    pass
+
+
+class KalshiWSClient:
+    """Streams orderbook deltas and trades over Kalshi's websocket feed.
+
+    The handshake is signed once with the given KalshiClient's key, and a
+    local copy of each subscribed orderbook is kept up to date from the
+    deltas, so snapshot() can stand in for polling get_market_orderbook.
+    On a disconnect or a sequence gap the connection is re-signed and
+    re-subscribed, which makes the server send a fresh snapshot. Server
+    error frames and exceptions raised by callbacks are logged and the
+    stream carries on.
+    """
+
+    def __init__(self, client, reconnect_delay=1.0):
+        self.client = client
+        self.url = (
+            client.base_url
+            .replace("https://", "wss://", 1)
+            .replace("/trade-api/v2", "/trade-api/ws/v2", 1)
+        )
+        self._sign_path = b"/trade-api/ws/v2"
+        self.reconnect_delay = reconnect_delay
+        self._orderbook_tickers = set()
+        self._orderbook_callbacks = []
+        self._trade_tickers = set()
+        self._trade_callbacks = []
+        self._books = {}
+        self._seeded = False
+        self._ids = itertools.count(1)
+        self._ws = None
+        self._closed = False
+
+    async def subscribe_orderbook(self, tickers, callback=None):
+        """Mirror the orderbooks of tickers; callback gets each update.
+
+        tickers is one ticker or an iterable of them. Subscriptions made
+        while run() is connected are sent on the open socket.
+        """
+        if callback is not None:
+            self._orderbook_callbacks.append(callback)
+        await self._add_tickers(
+            self._orderbook_tickers, "orderbook_delta", tickers
+        )
+
+    async def subscribe_trades(self, tickers, callback):
+        self._trade_callbacks.append(callback)
+        await self._add_tickers(self._trade_tickers, "trade", tickers)
+
+    async def _add_tickers(self, subscribed, channel, tickers):
+        if isinstance(tickers, str):
+            tickers = [tickers]
+        new = set(tickers) - subscribed
+        subscribed.update(new)
+        # Tickers added before the socket is up go out with the initial
+        # subscribe in run(); only re-send for a live connection.
+        if new and self._ws is not None:
+            await self._ws.send(self._command([channel], new))
+
+    def snapshot(self, ticker):
+        """Current book for ticker, shaped like get_market_orderbook's."""
+        book = self._books[ticker]
+        return {
+            side: [[price, qty] for price, qty in sorted(levels.items())]
+            for side, levels in book.items()
+        }
+
+    async def close(self):
+        self._closed = True
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def run(self):
+        """Connect and dispatch messages until close() is called."""
+        if not self._seeded:
+            await self._seed_from_rest()
+            self._seeded = True
+        while not self._closed:
+            try:
+                async with connect(
+                    self.url, additional_headers=self._auth_headers()
+                ) as ws:
+                    self._ws = ws
+                    await self._subscribe(ws)
+                    seqs = {}
+                    async for raw in ws:
+                        self._dispatch(orjson.loads(raw), seqs)
+            except (ConnectionClosed, OSError, _SequenceGap):
+                pass
+            finally:
+                self._ws = None
+            if not self._closed:
+                await asyncio.sleep(self.reconnect_delay)
+
+    def _auth_headers(self):
+        headers = self.client._request_headers("GET", self._sign_path)
+        headers["KALSHI-ACCESS-KEY"] = self.client.key_id
+        return headers
+
+    async def _seed_from_rest(self):
+        for ticker in self._orderbook_tickers:
+            if isinstance(self.client, AsyncKalshiClient):
+                response = await self.client.get_market_orderbook(ticker)
+            else:
+                response = await asyncio.to_thread(
+                    self.client.get_market_orderbook, ticker
+                )
+            self._set_book(ticker, response["orderbook"])
+
+    async def _subscribe(self, ws):
+        if self._orderbook_tickers:
+            await ws.send(self._command(
+                ["orderbook_delta"], self._orderbook_tickers
+            ))
+        if self._trade_tickers:
+            await ws.send(self._command(["trade"], self._trade_tickers))
+
+    def _command(self, channels, tickers):
+        return orjson.dumps({
+            "id": next(self._ids),
+            "cmd": "subscribe",
+            "params": {
+                "channels": channels,
+                "market_tickers": sorted(tickers),
+            },
+        })
+
+    def _set_book(self, ticker, orderbook):
+        self._books[ticker] = {
+            side: {price: qty for price, qty in orderbook.get(side) or ()}
+            for side in ("yes", "no")
+        }
+
+    def _dispatch(self, message, seqs):
+        kind = message.get("type")
+        if kind == "orderbook_snapshot" or kind == "orderbook_delta":
+            sid = message["sid"]
+            seq = message["seq"]
+            if sid in seqs and seq != seqs[sid] + 1:
+                raise _SequenceGap()
+            seqs[sid] = seq
+            msg = message["msg"]
+            if kind == "orderbook_snapshot":
+                self._set_book(msg["market_ticker"], msg)
+            else:
+                self._apply_delta(msg)
+            self._notify(self._orderbook_callbacks, msg)
+        elif kind == "trade":
+            self._notify(self._trade_callbacks, message["msg"])
+        elif kind == "error":
+            # Errors are per command (e.g. an unknown ticker); the other
+            # subscriptions on this connection are still live.
+            logger.error("Kalshi websocket error: %s", message.get("msg"))
+
+    @staticmethod
+    def _notify(callbacks, msg):
+        for callback in callbacks:
+            try:
+                callback(msg)
+            except Exception:
+                logger.exception("Kalshi websocket callback failed")
+
+    def _apply_delta(self, msg):
+        levels = self._books[msg["market_ticker"]][msg["side"]]
+        qty = levels.get(msg["price"], 0) + msg["delta"]
+        if qty > 0:
+            levels[msg["price"]] = qty
+        else:
+            levels.pop(msg["price"], None)
@@ -0,0 +1,127 @@
+import threading
+import time
+from concurrent.futures import Future
+from kalshiClient import AsyncKalshiClient
+
+
+class _Batcher:
+    def __init__(self, flush, max_batch, max_latency_ms):
+        self._flush = flush
+        self.max_batch = max_batch
+        self.max_latency = max_latency_ms / 1000
+        self._pending = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("OrderBatcher is closed")
+            self._pending.append((item, future))
+            self._cond.notify()
+        return future
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # The first order in the batch waits at most max_latency
+                # for company; a full batch goes out immediately.
+                deadline = time.monotonic() + self.max_latency
+                while len(self._pending) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+            self._send(batch)
+
+    def _send(self, batch):
+        try:
+            results = self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"batch of {len(batch)} returned {len(results)} results"
+                )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+def _match_results(entries, keys, field):
+    # Line results up with the submitted orders by id when every order
+    # has one, otherwise rely on the API preserving request order.
+    by_key = {e.get(field): e for e in entries if e.get(field) is not None}
+    if all(key is not None and key in by_key for key in keys):
+        return [by_key[key] for key in keys]
+    return entries
+
+
+class OrderBatcher:
+    """Coalesces single order creates/cancels into batched API calls.
+
+    client must be a KalshiClient; the async client is not supported.
+    create_order/cancel_order return a concurrent.futures.Future that
+    resolves to that order's entry from the batched response (check its
+    "error" field). A batch is flushed once it holds max_batch orders or
+    its oldest order has waited max_latency_ms.
+    """
+
+    def __init__(self, client, max_batch=20, max_latency_ms=10):
+        # The worker threads call the client synchronously; an async
+        # client would hand them coroutines that are never awaited.
+        if isinstance(client, AsyncKalshiClient):
+            raise TypeError("OrderBatcher needs a KalshiClient, not an "
+                            "AsyncKalshiClient")
+        self.client = client
+        self._creates = _Batcher(
+            self._flush_creates, max_batch, max_latency_ms
+        )
+        self._cancels = _Batcher(
+            self._flush_cancels, max_batch, max_latency_ms
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Flush anything still queued and stop the worker threads."""
+        self._creates.close()
+        self._cancels.close()
+
+    def create_order(self, order):
+        return self._creates.submit(order)
+
+    def cancel_order(self, order_id):
+        return self._cancels.submit(order_id)
+
+    def _flush_creates(self, orders):
+        response = self.client.batch_create_orders({"orders": orders})
+        return _match_results(
+            response["orders"],
+            [order.get("client_order_id") for order in orders],
+            "client_order_id",
+        )
+
+    def _flush_cancels(self, order_ids):
+        response = self.client.batch_cancel_orders({"ids": order_ids})
+        return _match_results(response["orders"], order_ids, "order_id")
@@ -1,34 +1,32 @@
-import datetime
+import time
 
 # TIME FUNCS #
 
 
 def get_seconds_since_epoch(dt):
-    dt_utc = dt.astimezone(datetime.timezone.utc)
-    return int(dt_utc.timestamp())
+    # timestamp() already reads naive datetimes as local time, exactly
+    # like astimezone(), so no UTC conversion is needed first.
+    return int(dt.timestamp())
 
 
 def get_curr_time_seconds():
-    curr_time = datetime.datetime.now()
-    timestamp = curr_time.timestamp()
-    curr_time_seconds = int(timestamp)
-    return curr_time_seconds
+    return time.time_ns() // 1_000_000_000
 
 
 def get_curr_time_milliseconds():
-    curr_time = datetime.datetime.now()
-    timestamp = curr_time.timestamp()
-    curr_time_milliseconds = int(timestamp * 1000)
-    return curr_time_milliseconds
+    return time.time_ns() // 1_000_000
+
+
+_PERIOD_INTERVALS = {
+    "minute": 1,
+    "hour": 60,
+    "day": 24 * 60,
+}
+_PERIOD_INTERVAL_ERROR = "period_interval must be 'minute', 'hour', or 'day'"
 
 
 def get_period_interval(string):
-    match string:
-        case "minute":
-            return 1
-        case "hour":
-            return 60 * 1
-        case "day":
-            return 24 * 60 * 1
-        case _:
-            raise Exception("period_interval must be 'minute', 'hour', or 'day")
\ No newline at end of file
+    try:
+        return _PERIOD_INTERVALS[string]
+    except KeyError:
+        raise ValueError(_PERIOD_INTERVAL_ERROR) from None